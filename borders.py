@@ -3,8 +3,9 @@
 Access a specific border type:
     type = SIDES["up"]*STYLES["double"] + SIDES["down"]*STYLES["double"]
     print(BORDERS[type])
+
+The BORDERS table is built on first access, so importing this module is cheap.
 """
-from collections import defaultdict
 
 # This value should not exceed 32/4 = 8. Bad things might happen.
 bits_per_style = 3  # allows up to 2 ** bits_per_style different styles
@@ -27,11 +28,7 @@ SIDES = {
 
 def mask_1(length):
     """Return a one-mask (0b1111...11) with a given bit length."""
-    mask = 1
-    for bit in range(length - 1):
-        mask <<= 1
-        mask += 1
-    return mask
+    return (1 << length) - 1
 
 
 def mask_side(side):
@@ -61,77 +58,96 @@ def to_str(x):
     return "<" + ",".join(sides) + ">"
 
 
-# 0baabbccdd - a=top, b=right, c=bottom, d=left
-
-u = SIDES["up"]
-d = SIDES["down"]
-l = SIDES["left"]
-r = SIDES["right"]
-D = STYLES["double"]
-t = STYLES["thin"]
-T = STYLES["thick"]
-F = STYLES["full"]
-
-BORDERS = {
-    0: " ",
-    l * D + r * D: "═",
-    u * D + d * D: "║",
-    d * t + r * D: "╒",
-    d * D + r * t: "╓",
-    d * D + r * D: "╔",
-    l * D + d * t: "╕",
-    d * D + l * t: "╖",
-    d * D + l * D: "╗",
-    u * t + r * D: "╘",
-    u * D + r * t: "╙",
-    u * D + r * D: "╚",
-    l * D + u * t: "╛",
-    l * t + u * D: "╜",
-    l * D + u * D: "╝",
-    u * t + r * D + d * t: "╞",
-    u * D + d * D + r * t: "╟",
-    u * D + r * D + d * D: "╠",
-    l * D + u * t + d * t: "╡",
-    l * t + u * D + d * D: "╢",
-    l * D + u * D + d * D: "╣",
-    l * D + r * D + d * t: "╤",
-    l * t + r * t + d * D: "╥",
-    l * D + r * D + d * D: "╦",
-    l * D + r * D + u * t: "╧",
-    u * D + l * t + r * t: "╨",
-    u * D + l * D + r * D: "╩",
-    u * t + d * t + l * D + r * D: "╪",
-    u * D + d * D + l * t + r * t: "╫",
-    u * D + r * D + l * D + d * D: "╬",
-    l * t + r * t: "─",
-    u * t + d * t: "│",
-    r * t + d * t: "┌",
-    l * t + d * t: "┐",
-    u * t + r * t: "└",
-    u * t + l * t: "┘",
-    u * t + r * t + d * t: "├",
-    u * t + d * t + l * t: "┤",
-    l * t + r * t + d * t: "┬",
-    u * t + l * t + r * t: "┴",
-    u * t + l * t + r * t + d * t: "┼",
-    l * F + r * F: "█",
-    u * F + d * F: "█",
-    r * F + d * F: "█",
-    l * F + d * F: "█",
-    u * F + r * F: "█",
-    u * F + l * F: "█",
-    u * F + r * F + d * F: "█",
-    u * F + d * F + l * F: "█",
-    l * F + r * F + d * F: "█",
-    u * F + l * F + r * F: "█",
-    u * F + l * F + r * F + d * F: "█",
-    # add your own styles here
-}
+def _build_borders():
+    """Assemble the border lookup table."""
+    # 0baabbccdd - a=top, b=right, c=bottom, d=left
+
+    u = SIDES["up"]
+    d = SIDES["down"]
+    l = SIDES["left"]
+    r = SIDES["right"]
+    D = STYLES["double"]
+    t = STYLES["thin"]
+    T = STYLES["thick"]
+    F = STYLES["full"]
+
+    return {
+        0: " ",
+        l * D + r * D: "═",
+        u * D + d * D: "║",
+        d * t + r * D: "╒",
+        d * D + r * t: "╓",
+        d * D + r * D: "╔",
+        l * D + d * t: "╕",
+        d * D + l * t: "╖",
+        d * D + l * D: "╗",
+        u * t + r * D: "╘",
+        u * D + r * t: "╙",
+        u * D + r * D: "╚",
+        l * D + u * t: "╛",
+        l * t + u * D: "╜",
+        l * D + u * D: "╝",
+        u * t + r * D + d * t: "╞",
+        u * D + d * D + r * t: "╟",
+        u * D + r * D + d * D: "╠",
+        l * D + u * t + d * t: "╡",
+        l * t + u * D + d * D: "╢",
+        l * D + u * D + d * D: "╣",
+        l * D + r * D + d * t: "╤",
+        l * t + r * t + d * D: "╥",
+        l * D + r * D + d * D: "╦",
+        l * D + r * D + u * t: "╧",
+        u * D + l * t + r * t: "╨",
+        u * D + l * D + r * D: "╩",
+        u * t + d * t + l * D + r * D: "╪",
+        u * D + d * D + l * t + r * t: "╫",
+        u * D + r * D + l * D + d * D: "╬",
+        l * t + r * t: "─",
+        u * t + d * t: "│",
+        r * t + d * t: "┌",
+        l * t + d * t: "┐",
+        u * t + r * t: "└",
+        u * t + l * t: "┘",
+        u * t + r * t + d * t: "├",
+        u * t + d * t + l * t: "┤",
+        l * t + r * t + d * t: "┬",
+        u * t + l * t + r * t: "┴",
+        u * t + l * t + r * t + d * t: "┼",
+        l * F + r * F: "█",
+        u * F + d * F: "█",
+        r * F + d * F: "█",
+        l * F + d * F: "█",
+        u * F + r * F: "█",
+        u * F + l * F: "█",
+        u * F + r * F + d * F: "█",
+        u * F + d * F + l * F: "█",
+        l * F + r * F + d * F: "█",
+        u * F + l * F + r * F: "█",
+        u * F + l * F + r * F + d * F: "█",
+        # add your own styles here
+    }
+
+
+_borders = None
+
+
+def __getattr__(name):
+    if name == "BORDERS":
+        return _get_borders()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_borders():
+    global _borders
+    if _borders is None:
+        _borders = _build_borders()
+    return _borders
 
 
 def get(x, debug=False, default="?"):
-    if x in BORDERS:
-        return BORDERS[x]
+    table = _borders if _borders is not None else _get_borders()
+    if x in table:
+        return table[x]
     if debug:
         return to_str(x)
     return default
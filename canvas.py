@@ -0,0 +1,340 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+from . import borders, cursor
+from .screen import Screen
+
+RESET = "\033[0m"
+
+
+class Canvas:
+    def __init__(self, windows=None, record=None):
+        """Initialize an empty canvas.
+
+        :param windows: An array of windows on the canvas
+        :param record: A file path or Recorder to record printed frames to
+            (see recorder.py)
+        """
+        self.size = cursor.get_terminal_size()
+        self.data = [[0 for j in range(self.size[1])] for i in range(self.size[0])]
+        # escape codes starting the style of content characters, or None
+        self.styles = [[None] * self.size[1] for i in range(self.size[0])]
+        self.is_printing = False
+        self.is_refreshing = False
+        self.debug_mode = False
+
+        # what the terminal currently shows, to print only what has changed
+        self.screen = Screen()
+        self._styled_rows = {}  # y -> printed row with escape codes
+        # frame pacing (see refresh)
+        self.latency = 0.0  # average seconds spent writing a frame
+        self.frame_times = deque(maxlen=1000)
+        self._next_frame = 0.0
+        self._pacing_lock = threading.Lock()
+        self._dropped = set()  # windows of dropped frames, None for all
+
+        self.windows = windows
+        if self.windows is None:
+            self.windows = []
+
+        # objects with a record(screen, runs) method, called with the screen
+        # and its changed runs after every print (see recorder.py and
+        # server.py)
+        self.listeners = []
+
+        self.recorder = record
+        self._owns_recorder = isinstance(record, (str, os.PathLike))
+        if self._owns_recorder:
+            from .recorder import Recorder
+
+            self.recorder = Recorder(record)
+        if self.recorder is not None:
+            self.listeners.append(self.recorder)
+
+    def add_border(self, position, border):
+        """Overlay a border onto the character at a given position.
+
+        :param position: A coordinate tuple for the new border
+        :param border: An integer representing the border type
+        """
+        if position[0] >= self.size[0] or position[1] >= self.size[1]:
+            return
+
+        if isinstance(self.data[position[0]][position[1]], str):
+            self.data[position[0]][position[1]] = 0
+        self.data[position[0]][position[1]] |= border
+
+    def remove_border(self, position, border):
+        """Remove a part of the border at a given position.
+
+        :param position: A coordinate tuple for the new border
+        :param border: An binary integer with ones with bits to remove
+        """
+        if position[0] >= self.size[0] or position[1] >= self.size[1]:
+            return
+
+        mask = ~border & borders.mask_1(borders.bits_per_style * 4)
+
+        if isinstance(self.data[position[0]][position[1]], str):
+            self.data[position[0]][position[1]] = 0
+        self.data[position[0]][position[1]] &= mask
+
+    def set_border(self, position, side, style):
+        """Remove the existing border on a side and replace it with a given style.
+
+        :param position: A coordinte tuple for the new border
+        :param side: String "up"|"down"|"left"|"right"
+        :param style: An integer representing the new border type
+        """
+        self.remove_border(position, borders.mask_side(side))
+        self.add_border(position, borders.SIDES[side] * style)
+
+    def set_content(self, position, content, style=None):
+        """Set the character at a given position.
+
+        :param style: An escape sequence starting the character's style
+        """
+        if position[0] >= self.size[0] or position[1] >= self.size[1]:
+            return
+        self.data[position[0]][position[1]] = content
+        self.styles[position[0]][position[1]] = style
+
+    def add_window(self, window):
+        """Add a Window object to the canvas."""
+        if window not in self.windows:
+            self.windows += window
+
+    def remove_window(self, window):
+        """Remove a Window object from canvas."""
+        if window in self.windows:
+            self.windows.remove(window)
+
+    def close(self):
+        """Close the recorder opened for record=path.
+
+        A Recorder passed in as record stays open, it belongs to the caller.
+        """
+        if self._owns_recorder:
+            self.recorder.close()
+            self.listeners.remove(self.recorder)
+            self._owns_recorder = False
+
+    def get_window_bounds(self, window=None):
+        if window is None:
+            x, y = (0, 0)
+            width, height = self.size
+        else:
+            x, y = window.position
+            width, height = window.size
+        return ((x, y), (width, height))
+
+    def update_size(self):
+        """Follow the size of the terminal, clearing the canvas if it changed."""
+        size = cursor.get_terminal_size()
+        if size != self.size:
+            self.size = size
+            self.data = [[0 for j in range(size[1])] for i in range(size[0])]
+            self.styles = [[None] * size[1] for i in range(size[0])]
+
+    def invalidate(self, bounds):
+        """Clear the canvas in a ((x, y), (width, height)) rectangle."""
+        (x, y), (width, height) = bounds
+        for i in range(max(x, 0), min(x + width, self.size[0])):
+            column = self.data[i]
+            for j in range(max(y, 0), min(y + height, self.size[1])):
+                column[j] = 0
+
+    def render(self, window=None):
+        """Scrap canvas data and re-render."""
+        self.update_size()
+        (x, y), (width, height) = self.get_window_bounds(window)
+        for j in range(y, height):
+            for i in range(x, width):
+                if isinstance(self.data, str):
+                    self.data[i][j] = 0
+        for w in self.windows if window is None else [window]:
+            w.render(self)
+
+    def print(self, window=None):
+        """Print the current canvas onto the terminal."""
+        while self.is_printing:
+            time.sleep(0.1)
+        self.is_printing = True
+        cursor.ensure_ansi()
+
+        start_pos, (width, height) = self.get_window_bounds(window)
+
+        self.buffer = ""
+        if not self.debug_mode:
+            self.buffer = cursor.move(*start_pos, now=False)
+
+        rows = []
+        styled_rows = {}  # y -> row with escape codes, for rows with styles
+        for j in range(start_pos[1], height):
+            row = ""
+            styled = ""
+            current = None  # the style in effect while printing the row
+            for i in range(start_pos[0], width):
+                px = self.data[i][j]
+                style = None
+                if isinstance(px, int):  # px is a border type
+                    px = borders.get(px)
+                else:  # px is a content character
+                    style = self.styles[i][j]
+                if style != current:
+                    styled += RESET if style is None else style
+                    current = style
+                row += px
+                styled += px
+            if current is not None:
+                styled += RESET
+            if styled != row:
+                styled_rows[j] = styled
+            rows.append(row)
+            self.buffer += styled
+            # move to a new line, unless it's the last line
+            if j != self.size[1] - 1:
+                self.buffer += cursor.move(start_pos[0], j + 1, now=False)  # "\n"
+
+        # print only the changed parts, if that is shorter than everything
+        runs = self.screen.update(start_pos, rows, self.size)
+        if runs is not None and not self.debug_mode:
+            # the screen only tracks text, rows with styles that changed are
+            # printed whole
+            printed = range(start_pos[1], start_pos[1] + len(rows))
+            restyled = {
+                y
+                for y in printed
+                if styled_rows.get(y) != self._styled_rows.get(y)
+            }
+            diff = "".join(
+                cursor.move(x, y, now=False) + text
+                for x, y, text in runs
+                if y not in restyled
+            )
+            for y in sorted(restyled):
+                row = styled_rows.get(y, rows[y - start_pos[1]])
+                diff += cursor.move(start_pos[0], y, now=False) + row
+            if len(diff) < len(self.buffer):
+                self.buffer = diff
+        for y in range(start_pos[1], start_pos[1] + len(rows)):
+            self._styled_rows.pop(y, None)
+        self._styled_rows.update(styled_rows)
+
+        start = time.perf_counter()
+        print(self.buffer, end="")
+        sys.stdout.flush()
+        self._measure(time.perf_counter() - start)
+
+        for listener in self.listeners:
+            listener.record(self.screen, runs)
+        self.is_printing = False
+
+    def _measure(self, duration):
+        """Update the output statistics after writing a frame."""
+        now = time.perf_counter()
+        self.frame_times.append(now)
+        self.latency = 0.8 * self.latency + 0.2 * duration
+        # give a slow terminal as long to drain the output as it took to
+        # accept it, before writing the next frame
+        self._next_frame = now + self.latency
+
+    @property
+    def fps(self):
+        """The number of frames printed during the last second."""
+        since = time.perf_counter() - 1
+        return sum(1 for t in self.frame_times if t > since)
+
+    @property
+    def refresh_pending(self):
+        """Whether a dropped frame is waiting to be printed by refresh."""
+        return bool(self._dropped)
+
+    @property
+    def frame_delay(self):
+        """Seconds until the terminal is ready for the next frame."""
+        return max(0.0, self._next_frame - time.perf_counter())
+
+    def refresh(self, window=None):
+        """Render self (or only a window) and print to (0, 0).
+
+        When the terminal is still busy with an earlier frame, the frame is
+        dropped instead of waiting. The next refresh that is printed also
+        covers the dropped frames, so call refresh again (after frame_delay)
+        while refresh_pending is set to be sure the latest state is shown.
+        Rendering always happens on the caller's thread.
+
+        :return: Whether the frame was printed
+        """
+        with self._pacing_lock:
+            if self.is_refreshing or time.perf_counter() < self._next_frame:
+                self._dropped.add(window)
+                return False
+            self.is_refreshing = True
+            # a frame dropped for another window needs the whole canvas
+            dropped = self._dropped - {window}
+            if dropped:
+                window = None
+            self._dropped = set()
+
+        cursor.ensure_ansi()
+        self.render(window)
+        print("\x1B7", end="")  # save cursor position
+        self.print(window)
+        print("\x1B8", end="", flush=True)  # restore cursor position
+
+        with self._pacing_lock:
+            self.is_refreshing = False
+        return True
+
+    def print_line(self, position, text):
+        if isinstance(text, str):
+            for ch in text:
+                self.set_content(position, ch)
+                position = (position[0] + 1, position[1])
+            return
+
+        # a Colour, printed segment by segment
+        from .colour import encode_options
+
+        x, y = position
+        for chars, style in text.parts():
+            escape = "\033[" + encode_options(style) + "m" if style else None
+            for ch in chars:
+                self.set_content((x, y), ch, escape)
+                x += 1
+
+
+if __name__ == "__main__":
+    import random
+
+    from .window import Window
+
+    i = 0
+    j = 0
+    background = Window(size=cursor.get_terminal_size(), style="double")
+    static = Window(style="thin", size=(10, 10), position=(2, 1))
+    cat = Window(style="thin", size=(1, 4), position=(6, 9))
+    canvas = Canvas([background, static, cat])
+
+    while True:
+        i %= 10
+        i += 1
+        j %= 10
+        j += (
+            random.randint(0, 2)
+            * random.randint(0, 1)
+            * random.randint(0, 1)
+            * random.randint(0, 1)
+        )
+        static.print(f"Welcome to Iteration {i},{j}")
+        static.size = (10 + j, 10)
+        cat.position = (6 + j, 9 + j)
+        cat.size = (1 + i, 4)
+        canvas.render()
+        canvas.print(debug=False)
+        cursor.move(0, 0)
+        time.sleep(0.1)
@@ -1,3 +1,5 @@
+import re
+
 # colour options
 NORMAL = 0
 
@@ -94,8 +96,12 @@ class ColourSegment:
 
         self.style = merged
 
+    def escape_code(self):
+        """Return the escape sequence that starts this segment's style."""
+        return "\033[" + encode_options(self.style) + "m"
+
     def __str__(self):
-        return "\033[" + encode_options(self.style) + "m" + self.text + "\033[0m"
+        return self.escape_code() + self.text + "\033[0m"
 
     def __len__(self):
         return len(self.text)
@@ -122,6 +128,12 @@ class ColourIterator:
 
 
 class Colour:
+    # Parsed text is kept as it was split by AnsiParser, and only turned into
+    # (text, style) pairs and then ColourSegments when those are used
+    _segments = None
+    _parts = None
+    _ansi = None  # (escape-split text, state at its start)
+
     def __init__(self, text, style=None, merge_style=True):
         """Initialize a Colour object.
 
@@ -140,6 +152,37 @@ class Colour:
         else:
             raise ValueError("Invalid text " + str(text))
 
+    @classmethod
+    def from_parts(cls, parts):
+        """Create a Colour from a list of (text, style) pairs."""
+        colour = cls.__new__(cls)
+        colour._parts = parts or [("", {})]
+        return colour
+
+    @classmethod
+    def _from_ansi(cls, parts, state):
+        colour = cls.__new__(cls)
+        colour._ansi = (parts, state)
+        return colour
+
+    @property
+    def segments(self):
+        if self._segments is None:
+            self._segments = [ColourSegment(t, style) for t, style in self.parts()]
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments):
+        self._segments = segments
+
+    def parts(self):
+        """Return the (text, style) pairs of all segments."""
+        if self._segments is not None:
+            return [(seg.text, seg.style) for seg in self._segments]
+        if self._parts is None:
+            self._parts = _ansi_pairs(*self._ansi) or [("", {})]
+        return self._parts
+
     def __str__(self):
         return "".join([str(seg) for seg in self.segments])
 
@@ -163,17 +206,25 @@ class Colour:
         return self
 
     def __len__(self):
-        return sum([len(seg) for seg in self.segments])
+        return sum([len(text) for text, _ in self.parts()])
 
     def __iter__(self):
         return ColourIterator(self)
 
     def __getitem__(self, key):
+        if isinstance(key, slice) and key.step in (None, 1):
+            # slice the segments, sharing their styles
+            start, stop, _ = key.indices(len(self))
+            parts = []
+            offset = 0
+            for text, style in self.parts():
+                end = offset + len(text)
+                if end > start and offset < stop:
+                    text = text[max(start - offset, 0) : stop - offset]
+                    parts.append((text, style))
+                offset = end
+            return Colour.from_parts(parts)
         return [ch for ch in self][key]
-        # if isinstance(key, slice):
-        #     return [self.__getitem__(i) for i in slice]
-        # else:
-        #     pass
 
     # def __setitem__(self, key, value):
     #     pass
@@ -234,6 +285,197 @@ class Simple(Colour):
         super().__init__(text, {"foreground": colour}, merge_style)
 
 
+##########
+
+# escape sequences: CSI (capturing parameters and final byte; only SGR, "m",
+# affects the style), OSC terminated by BEL or ST, character set selection
+# and other two-byte sequences
+_escape = re.compile(
+    r"\x1b(?:\[([0-?]*)[ -/]*([@-~])"
+    r"|\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    r"|[()*+].|[@-Z\\^_`a-z0-9=>])"
+)
+# the start of an escape sequence that may be completed by the next chunk
+_escape_prefix = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07]*|[()*+])?")
+# longest incomplete escape sequence kept for the next chunk; anything longer
+# is a broken sequence (like an OSC that is never terminated) and is dropped
+_MAX_PENDING = 256
+
+_DEFAULT_STATE = (None, None, ())
+_styles = {}  # state -> style, shared between all segments with that style
+_transitions = {}  # (state, SGR parameters) -> state
+
+
+def _style(state):
+    """Return the interned style object for a (fg, bg, extra) state."""
+    try:
+        return _styles[state]
+    except KeyError:
+        foreground, background, extra = state
+        style = {}
+        if foreground is not None:
+            style["foreground"] = foreground
+        if background is not None:
+            style["background"] = background
+        if extra:
+            style["extra"] = list(extra)
+        _styles[state] = style
+        return style
+
+
+def _colour_name(code):
+    """Convert the last digit of an SGR colour code to a colour string."""
+    return COLOURS[code % 10]
+
+
+def _apply_sgr(state, params):
+    """Return the state after an SGR sequence with the given parameters."""
+    key = (state, params)
+    try:
+        return _transitions[key]
+    except KeyError:
+        pass
+
+    foreground, background, extra = state
+    extra = set(extra)
+    codes = params.replace(":", ";").split(";")
+    codes = [int(c) if c.isdigit() else 0 for c in codes]
+    i = 0
+    while i < len(codes):
+        code = codes[i]
+        if code == NORMAL:
+            foreground, background, extra = None, None, set()
+        elif code in (BOLD, UNDERLINE, BLINK):
+            extra.add(code)
+        elif code == 22:
+            extra.discard(BOLD)
+        elif code in (24, 25):
+            extra.discard(code - 20)
+        elif FOREGROUND <= code < FOREGROUND + 8:
+            foreground = _colour_name(code)
+        elif BACKGROUND <= code < BACKGROUND + 8:
+            background = _colour_name(code)
+        elif FOREGROUND + BRIGHT <= code < FOREGROUND + BRIGHT + 8:
+            foreground = "bright_" + _colour_name(code)
+        elif BACKGROUND + BRIGHT <= code < BACKGROUND + BRIGHT + 8:
+            background = "bright_" + _colour_name(code)
+        elif code == 39:
+            foreground = None
+        elif code == 49:
+            background = None
+        elif code in (38, 48):
+            # 256-colour and RGB colours have no style equivalent, skip them
+            if i + 1 < len(codes) and codes[i + 1] == 5:
+                i += 2
+            elif i + 1 < len(codes) and codes[i + 1] == 2:
+                i += 4
+        i += 1
+
+    new_state = (foreground, background, tuple(sorted(extra)))
+    if len(_transitions) > 4096:
+        _transitions.clear()
+    _transitions[key] = new_state
+    return new_state
+
+
+def _resets(params):
+    """Whether an SGR sequence starts by resetting all attributes."""
+    return params in ("", "0") or params.startswith(("0;", ";"))
+
+
+def _end_state(state, parts):
+    """Return the state after the SGR sequences in escape-split text."""
+    # final bytes are at 2, 5, 8, ...; nothing before the last reset matters
+    first = 2
+    for i in range(len(parts) - 2, 1, -3):
+        if parts[i] == "m" and _resets(parts[i - 1]):
+            first = i
+            break
+    for i in range(first, len(parts), 3):
+        if parts[i] == "m":
+            state = _apply_sgr(state, parts[i - 1])
+    return state
+
+
+def _ansi_pairs(parts, state):
+    """Return the (text, style) pairs of escape-split text."""
+    style = _style(state)
+    pairs = []
+    append = pairs.append
+    if parts[0]:
+        append((parts[0], style))
+    for params, final, text in zip(parts[1::3], parts[2::3], parts[3::3]):
+        if final == "m":
+            state = _apply_sgr(state, params)
+            style = _style(state)
+        if text:
+            append((text, style))
+    return pairs
+
+
+class AnsiParser:
+    """Convert text with ANSI escape codes into Colour objects.
+
+    The parser keeps the current style and any incomplete escape sequence
+    between calls to feed, so a stream can be fed in arbitrary chunks.
+    Escape sequences other than colours are dropped.
+    """
+
+    def __init__(self):
+        self.state = _DEFAULT_STATE
+        self.pending = ""
+
+    @property
+    def plain(self):
+        """Whether text without escape codes would come out unstyled."""
+        return self.state == _DEFAULT_STATE and not self.pending
+
+    def feed(self, text, final=False):
+        """Parse a chunk of text and return it as a Colour.
+
+        :param final: Whether no escape sequence continues past this chunk,
+            like at the end of a line; an incomplete one is dropped
+        """
+        if self.pending:
+            text = self.pending + text
+            self.pending = ""
+        parts = _escape.split(text)
+        # an escape sequence cut off by the end of the chunk, starting at the
+        # first ESC in the tail that begins a valid prefix
+        tail = parts[-1]
+        escape = tail.find("\x1b")
+        while escape != -1:
+            if _escape_prefix.fullmatch(tail, escape) is not None:
+                if not final and len(tail) - escape <= _MAX_PENDING:
+                    self.pending = tail[escape:]
+                parts[-1] = tail[:escape]
+                break
+            escape = tail.find("\x1b", escape + 1)
+
+        # ESC characters that start no known sequence would corrupt the
+        # layout, remove them
+        escapes = len(parts) // 3
+        if text.count("\x1b") - self.pending.count("\x1b") > escapes:
+            for i in range(0, len(parts), 3):
+                parts[i] = parts[i].replace("\x1b", "")
+
+        # styles are only resolved when the text is used, here it is enough
+        # to know the state after the chunk
+        colour = Colour._from_ansi(parts, self.state)
+        self.state = _end_state(self.state, parts)
+        return colour
+
+    def reset(self):
+        """Forget the current style and any incomplete escape sequence."""
+        self.state = _DEFAULT_STATE
+        self.pending = ""
+
+
+def from_ansi(text):
+    """Convert a string with ANSI escape codes into a Colour."""
+    return AnsiParser().feed(text, final=True)
+
+
 # desired syntax:
 # "Hello " + Red(username) + "!"
 # or
@@ -10,13 +10,10 @@ except:
     pass
 """
 import os
-import re
 import sys
 
-if sys.platform == "win32":
-    from ctypes import byref, windll, wintypes
-else:
-    import termios
+# Platform-specific modules (termios, ctypes) and re are imported by the
+# functions that need them, so that importing pycat never touches the terminal.
 
 # input flags
 ENABLE_PROCESSED_INPUT = 0x0001
@@ -36,11 +33,15 @@ ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004  # VT100 (Win 10)
 
 def get_console_mode(of_stdout=True, full=False):
     if sys.platform == "win32":
+        from ctypes import byref, windll, wintypes
+
         mode = wintypes.DWORD()
         handle = windll.kernel32.GetStdHandle(-11 if of_stdout else -10)
         windll.kernel32.GetConsoleMode(handle, byref(mode))
         return mode.value
     else:
+        import termios
+
         mode = termios.tcgetattr(sys.stdout if of_stdout else sys.stdin)
         return mode if full else mode[3]  # local modes only
 
@@ -48,10 +49,14 @@ def get_console_mode(of_stdout=True, full=False):
 def set_console_mode(mode, of_stdout=True):
     old_mode = get_console_mode(of_stdout, full=True)
     if sys.platform == "win32":
+        from ctypes import windll
+
         handle = windll.kernel32.GetStdHandle(-11 if of_stdout else -10)
         windll.kernel32.SetConsoleMode(handle, mode)
         return old_mode
     else:
+        import termios
+
         handle = sys.stdout if of_stdout else sys.stdin
         new_mode = old_mode
         new_mode[3] = mode
@@ -67,12 +72,23 @@ def update_console_mode(flags, mask, of_stdout=True):
     # atexit.register(set_console_mode, old_mode)
 
 
+_ansi_enabled = False
+
+
 def enable_ansi():
+    global _ansi_enabled
     if sys.platform == "win32":
         flag = mask = ENABLE_VIRTUAL_TERMINAL_PROCESSING
         update_console_mode(flag, mask, of_stdout=True)
     else:
         pass  # linux has ANSI escape codes enabled by default
+    _ansi_enabled = True
+
+
+def ensure_ansi():
+    """Enable ANSI escape codes, unless that has already been done."""
+    if not _ansi_enabled:
+        enable_ansi()
 
 
 def get_cursor_pos():
@@ -83,6 +99,8 @@ def get_cursor_pos():
     if sys.platform == "win32":
         flag = mask = ENABLE_ECHO_INPUT | ENABLE_LINE_INPUT
     else:
+        import termios
+
         flag = mask = termios.ECHO | termios.ICANON
     old_stdin = update_console_mode(~flag, mask, of_stdout=False)
 
@@ -93,6 +111,8 @@ def get_cursor_pos():
     read = ""
     while not read.endswith("R"):
         read += sys.stdin.read(1)
+    import re
+
     res = re.match(r".*\[(?P<y>\d*);(?P<x>\d*)R", read)
     pos = (int(res.group("x")) - 1, int(res.group("y")) - 1)
 
@@ -0,0 +1,260 @@
+"""Computing window geometry from splits, grids and constraints.
+
+A layout is a tree of nodes. Pane nodes hold a Window, Split and Grid nodes
+divide their rectangle among their children:
+
+    layout = Layout(
+        Split("vertical", [
+            Pane(header, min=3, max=3),
+            Split("horizontal", [Pane(tree, weight=1), Pane(log, weight=3)]),
+        ])
+    )
+    layout.apply(canvas)  # after every resize or constraint change
+
+Each node remembers the rectangle it was last solved for, so only subtrees
+whose rectangle or constraints have changed are solved again. Rectangles are
+((x, y), (width, height)) tuples, like Canvas.get_window_bounds returns.
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def distribute(length, constraints):
+    """Divide a length among items with (min, max, weight) constraints.
+
+    Every item gets at least its minimum, then the rest is shared in
+    proportion to the weights, without exceeding any maximum (None for no
+    maximum). If not even the minimums fit, they are shrunk in proportion.
+    Results are cached, since resizing repeats the same sizes.
+
+    :return: A tuple with the length of each item, adding up to at most length
+    """
+    sizes = [minimum for minimum, _, _ in constraints]
+    total_minimum = sum(sizes)
+    if total_minimum > length:
+        return _shrink(max(length, 0), sizes, total_minimum)
+    growing = [i for i, (_, _, weight) in enumerate(constraints) if weight > 0]
+    remaining = length - sum(sizes)
+    while remaining > 0 and growing:
+        total_weight = sum(constraints[i][2] for i in growing)
+        shares = {}
+        given = 0
+        cumulative = 0
+        for i in growing:
+            # cumulative rounding, so that the shares add up exactly
+            cumulative += constraints[i][2]
+            share = int(remaining * cumulative // total_weight) - given
+            given += share
+            shares[i] = share
+        capped = []
+        for i in growing:
+            maximum = constraints[i][1]
+            if maximum is not None and sizes[i] + shares[i] >= maximum:
+                capped.append(i)
+        if not capped:
+            for i in growing:
+                sizes[i] += shares[i]
+            break
+        # fill the capped items and share what is left among the others
+        for i in capped:
+            remaining -= constraints[i][1] - sizes[i]
+            sizes[i] = constraints[i][1]
+            growing.remove(i)
+    return tuple(sizes)
+
+
+def _shrink(length, sizes, total):
+    """Scale sizes adding up to total down to add up to length."""
+    shrunk = []
+    given = 0
+    cumulative = 0
+    for size in sizes:
+        cumulative += size
+        share = length * cumulative // total - given
+        given += share
+        shrunk.append(share)
+    return tuple(shrunk)
+
+
+class Node:
+    def __init__(self, min=0, max=None, weight=1):
+        """Initialize a layout node.
+
+        :param min: Minimum length along the parent split
+        :param max: Maximum length along the parent split, None for no limit
+        :param weight: Share of the leftover length along the parent split
+        """
+        self.min = min
+        self.max = max
+        self.weight = weight
+        self.parent = None
+        self.rect = None
+        self.dirty = True
+
+    @property
+    def constraints(self):
+        return (self.min, self.max, self.weight)
+
+    def set(self, **constraints):
+        """Change min, max and/or weight and mark the layout for solving."""
+        for key, value in constraints.items():
+            if key not in ("min", "max", "weight"):
+                raise ValueError("Invalid constraint " + key)
+            setattr(self, key, value)
+        self.invalidate()
+
+    def invalidate(self):
+        """Make the parent solve this node again on the next solve."""
+        node = self.parent
+        while node is not None and not node.dirty:
+            node.dirty = True
+            node = node.parent
+
+    def solve(self, rect):
+        """Lay the node out in a rectangle.
+
+        :return: A list of rectangles whose contents have moved or resized
+        """
+        if rect == self.rect and not self.dirty:
+            return []
+        dirty = self._solve(rect)
+        self.rect = rect
+        self.dirty = False
+        return dirty
+
+    def _solve(self, rect):
+        raise NotImplementedError
+
+
+class Pane(Node):
+    def __init__(self, window, **constraints):
+        """A node holding a single window.
+
+        :param window: The Window to position
+        """
+        super().__init__(**constraints)
+        self.window = window
+
+    def _solve(self, rect):
+        position, size = rect
+        self.window.position = position
+        self.window.size = size
+        if self.rect is None:
+            return [rect]
+        return [self.rect, rect]
+
+
+class Split(Node):
+    def __init__(self, direction, children, **constraints):
+        """A node dividing its rectangle into a row or a column.
+
+        :param direction: "horizontal" (side by side) or "vertical" (stacked)
+        :param children: A list of nodes
+        """
+        super().__init__(**constraints)
+        if direction not in ("horizontal", "vertical"):
+            raise ValueError("Invalid direction " + str(direction))
+        self.direction = direction
+        self.children = list(children)
+        for child in self.children:
+            child.parent = self
+
+    def _solve(self, rect):
+        (x, y), (width, height) = rect
+        constraints = tuple(child.constraints for child in self.children)
+        if self.direction == "horizontal":
+            lengths = distribute(width, constraints)
+        else:
+            lengths = distribute(height, constraints)
+
+        dirty = []
+        offset = 0
+        for child, length in zip(self.children, lengths):
+            if self.direction == "horizontal":
+                child_rect = ((x + offset, y), (length, height))
+            else:
+                child_rect = ((x, y + offset), (width, length))
+            dirty += child.solve(child_rect)
+            offset += length
+        return dirty
+
+
+class Grid(Node):
+    def __init__(
+        self,
+        children,
+        columns,
+        column_constraints=None,
+        row_constraints=None,
+        **constraints,
+    ):
+        """A node arranging its children in a grid, row by row.
+
+        :param children: A list of nodes; their own constraints are ignored
+        :param columns: The number of columns
+        :param column_constraints: A (min, max, weight) tuple for each
+            column, equal weights by default
+        :param row_constraints: A (min, max, weight) tuple for each row,
+            at least as many as the children fill
+        """
+        super().__init__(**constraints)
+        if columns < 1:
+            raise ValueError("A grid needs at least one column")
+        self.children = list(children)
+        for child in self.children:
+            child.parent = self
+        rows = -(-len(self.children) // columns)
+        self.column_constraints = tuple(
+            tuple(c) for c in column_constraints or [(0, None, 1)] * columns
+        )
+        self.row_constraints = tuple(
+            tuple(c) for c in row_constraints or [(0, None, 1)] * rows
+        )
+        given = len(self.column_constraints)
+        if given != columns:
+            raise ValueError(f"Expected {columns} column constraints, got {given}")
+        given = len(self.row_constraints)
+        if given < rows:
+            raise ValueError(f"Expected {rows} row constraints, got {given}")
+
+    def _solve(self, rect):
+        (x, y), (width, height) = rect
+        widths = distribute(width, self.column_constraints)
+        heights = distribute(height, self.row_constraints)
+        columns = len(widths)
+
+        dirty = []
+        for i, child in enumerate(self.children):
+            row, column = divmod(i, columns)
+            child_x = x + sum(widths[:column])
+            child_y = y + sum(heights[:row])
+            child_rect = ((child_x, child_y), (widths[column], heights[row]))
+            dirty += child.solve(child_rect)
+        return dirty
+
+
+class Layout:
+    def __init__(self, root):
+        """Lay windows out according to a tree of nodes.
+
+        :param root: The top Node, filling the whole canvas
+        """
+        self.root = root
+
+    def solve(self, size):
+        """Lay the tree out for a canvas size.
+
+        :return: A list of rectangles whose contents have moved or resized
+        """
+        return self.root.solve(((0, 0), tuple(size)))
+
+    def apply(self, canvas):
+        """Lay the tree out for a canvas and clear the rectangles that changed.
+
+        :return: A list of rectangles whose contents have moved or resized
+        """
+        canvas.update_size()
+        dirty = self.solve(canvas.size)
+        for rect in dirty:
+            canvas.invalidate(rect)
+        return dirty
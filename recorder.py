@@ -0,0 +1,195 @@
+"""Recording and replaying canvas frames.
+
+A recording starts with MAGIC, followed by one block per printed frame:
+
+    kind (1 byte) | timestamp (8 byte double) | length (4 bytes) | data
+
+`data` is zlib-compressed. Every KEYFRAME block starts a new compression
+stream and holds the whole screen, so playback can start at any keyframe;
+DIFF blocks continue the stream and hold only the changed runs of cells.
+Uncompressed, a frame is:
+
+    width, height (2 x 2 bytes) | runs of (x, y, length, utf-8 text)
+
+Replay a recording with:
+    python -m pycat.recorder FILE [--speed 2] [--start 03:12]
+"""
+import struct
+import time
+import zlib
+
+MAGIC = b"PYCATREC1\n"
+
+DIFF = 0
+KEYFRAME = 1
+
+_block = struct.Struct(">BdI")
+_size = struct.Struct(">HH")
+_run = struct.Struct(">HHH")
+
+
+def encode_frame(size, runs):
+    """Return the uncompressed bytes of a frame."""
+    payload = [_size.pack(*size)]
+    for x, y, text in runs:
+        text = text.encode("utf-8")
+        payload.append(_run.pack(x, y, len(text)))
+        payload.append(text)
+    return b"".join(payload)
+
+
+def decode_frame(data):
+    """Return the size and runs of an uncompressed frame."""
+    size = _size.unpack_from(data)
+    runs = []
+    offset = _size.size
+    while offset < len(data):
+        x, y, length = _run.unpack_from(data, offset)
+        offset += _run.size
+        runs.append((x, y, data[offset : offset + length].decode("utf-8")))
+        offset += length
+    return size, runs
+
+
+class Recorder:
+    def __init__(self, path, keyframe_interval=10.0, level=1):
+        """Start recording frames into a file.
+
+        :param path: The file to write the recording to
+        :param keyframe_interval: Seconds between full-screen keyframes
+        :param level: zlib compression level
+        """
+        self.keyframe_interval = keyframe_interval
+        self.level = level
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.size = None
+        self.last_keyframe = None
+        self.compressor = None
+
+    def record(self, screen, runs):
+        """Record a printed frame.
+
+        :param screen: The Screen of the canvas, after the frame
+        :param runs: The (x, y, text) runs that changed, or None if all did
+        """
+        now = time.time()
+        keyframe_due = (
+            runs is None
+            or screen.size != self.size
+            or self.last_keyframe is None
+            or now - self.last_keyframe >= self.keyframe_interval
+        )
+        self.size = screen.size
+        if keyframe_due:
+            self.last_keyframe = now
+            self.compressor = zlib.compressobj(self.level)
+            runs = [(0, j, line) for j, line in enumerate(screen.lines)]
+            self._write(KEYFRAME, now, runs)
+        elif runs:
+            self._write(DIFF, now, runs)
+
+    def _write(self, kind, timestamp, runs):
+        payload = encode_frame(self.size, runs)
+        data = self.compressor.compress(payload)
+        data += self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        self.file.write(_block.pack(kind, timestamp, len(data)) + data)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def read_frames(path, start=None):
+    """Yield (timestamp, kind, size, runs) for each frame in a recording.
+
+    :param path: The recording file
+    :param start: If given, skip to the last keyframe at or before this time
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a pycat recording: " + str(path))
+
+        begin = file.tell()
+        if start is not None:
+            # find the last keyframe before start without decompressing
+            while True:
+                header = file.read(_block.size)
+                if len(header) < _block.size:
+                    break
+                kind, timestamp, length = _block.unpack(header)
+                if timestamp > start:
+                    break
+                if kind == KEYFRAME:
+                    begin = file.tell() - _block.size
+                file.seek(length, 1)
+        file.seek(begin)
+
+        decompressor = None
+        while True:
+            header = file.read(_block.size)
+            if len(header) < _block.size:
+                return
+            kind, timestamp, length = _block.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                return  # the recording was cut off mid-frame
+            if kind == KEYFRAME:
+                decompressor = zlib.decompressobj()
+            elif decompressor is None:
+                continue
+            size, runs = decode_frame(decompressor.decompress(data))
+            yield timestamp, kind, size, runs
+
+
+def replay(path, speed=1.0, start=None, canvas=None):
+    """Play a recording back onto the terminal.
+
+    :param path: The recording file
+    :param speed: Playback speed multiplier
+    :param start: Timestamp to start playing from
+    :param canvas: The Canvas to print frames with
+    """
+    if canvas is None:
+        from .canvas import Canvas
+
+        canvas = Canvas()
+
+    previous = None
+    for timestamp, kind, size, runs in read_frames(path, start):
+        for x, y, text in runs:
+            canvas.print_line((x, y), text)
+        if start is not None and timestamp < start:
+            continue  # catching up to the starting point
+        if previous is not None and speed > 0:
+            time.sleep(max(0, timestamp - previous) / speed)
+        previous = timestamp
+        canvas.print()
+
+
+def _parse_start(value, path):
+    """Parse a time of day (HH:MM[:SS]) on the recording's first day."""
+    import datetime
+
+    first = next(read_frames(path), None)
+    if first is None:
+        return None
+    day = datetime.datetime.fromtimestamp(first[0])
+    hour, minute, second = ([int(p) for p in value.split(":")] + [0])[:3]
+    moment = day.replace(hour=hour, minute=minute, second=second, microsecond=0)
+    return moment.timestamp()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a pycat recording.")
+    parser.add_argument("path")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--start", help="time of day to start at, HH:MM[:SS]")
+    args = parser.parse_args()
+
+    start = None
+    if args.start is not None:
+        start = _parse_start(args.start, args.path)
+    replay(args.path, speed=args.speed, start=start)
@@ -0,0 +1,51 @@
+"""Tracking what a terminal shows, to print only what has changed."""
+
+
+def changed_span(old, new):
+    """Return the start and end of the part of a line that has changed."""
+    if len(old) != len(new):
+        return 0, len(new)
+    start = 0
+    end = len(new)
+    while start < end and old[start] == new[start]:
+        start += 1
+    while end > start and old[end - 1] == new[end - 1]:
+        end -= 1
+    return start, end
+
+
+class Screen:
+    """The last known contents of a canvas, as a list of lines."""
+
+    def __init__(self):
+        self.size = None
+        self.lines = []
+
+    def update(self, position, rows, size):
+        """Apply a printed area of the canvas.
+
+        :param position: The x,y coordinates of the top left printed cell
+        :param rows: A list of printed lines
+        :param size: The size of the whole canvas
+        :return: A list of (x, y, text) runs that have changed, or None if the
+            canvas was resized and everything must be considered changed
+        """
+        x, y = position
+        width, height = size
+        resized = size != self.size
+        if resized:
+            self.size = size
+            self.lines = [" " * width for _ in range(height)]
+
+        runs = []
+        for j, row in enumerate(rows, y):
+            if j >= height:
+                break
+            old = self.lines[j]
+            new = (old[:x] + row + old[x + len(row) :])[:width]
+            if new == old:
+                continue
+            self.lines[j] = new
+            start, end = changed_span(old, new)
+            runs.append((start, j, new[start:end]))
+        return None if resized else runs
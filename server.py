@@ -0,0 +1,252 @@
+"""Sharing one canvas with many viewers over a Unix domain socket.
+
+The process owning the canvas starts a server:
+    server = CanvasServer(canvas, "/tmp/dashboard.sock")
+
+and any number of viewers attach to it, tmux-style:
+    python -m pycat.server /tmp/dashboard.sock
+
+Rendering happens once, in the server. Each printed frame only marks the
+changed lines as dirty for every client; a sender thread per client sends
+whatever is dirty when the client is ready for it, so frames for slow
+clients are coalesced instead of blocking the renderer. Every client sends
+its own terminal size and receives a view cropped to fit it.
+
+Messages from the server are a 4-byte length followed by a frame in the
+format of recorder.encode_frame. Messages from a client are its width and
+height (2 x 2 bytes).
+"""
+import errno
+import os
+import select
+import socket
+import stat
+import struct
+import threading
+
+from . import cursor
+from .recorder import decode_frame, encode_frame
+
+_length = struct.Struct(">I")
+_size = struct.Struct(">HH")
+
+
+def _recv_exactly(sock, length):
+    data = b""
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return data
+
+
+def _remove_stale_socket(path):
+    """Remove a socket nobody listens on, refusing to remove anything else."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError("Not a socket: " + str(path))
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError as e:
+        if e.errno != errno.ECONNREFUSED:
+            raise
+        os.unlink(path)
+    else:
+        raise FileExistsError("Socket in use: " + str(path))
+    finally:
+        probe.close()
+
+
+class _Client:
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.size = None
+        self.dirty = set()
+        self.full = True  # send the whole view with the next frame
+        self.closed = False
+        self.ready = threading.Condition(server.lock)
+        threading.Thread(target=self._receive, daemon=True).start()
+        threading.Thread(target=self._send, daemon=True).start()
+
+    def mark(self, rows=None):
+        """Mark rows (or everything, if None) to be sent. Hold server.lock."""
+        if rows is None:
+            self.full = True
+        else:
+            self.dirty.update(rows)
+        self.ready.notify()
+
+    def _receive(self):
+        try:
+            while True:
+                size = _size.unpack(_recv_exactly(self.sock, _size.size))
+                with self.server.lock:
+                    self.size = size
+                    self.mark()
+        except OSError:
+            self.close()
+
+    def _send(self):
+        try:
+            while True:
+                with self.server.lock:
+                    while not self.closed and (
+                        self.size is None or not (self.full or self.dirty)
+                    ):
+                        self.ready.wait()
+                    if self.closed:
+                        return
+                    frame = self._frame()
+                    self.full = False
+                    self.dirty = set()
+                # sending happens outside of the lock, so the renderer
+                # keeps marking rows while a slow client catches up
+                self.sock.sendall(_length.pack(len(frame)) + frame)
+        except OSError:
+            self.close()
+
+    def _frame(self):
+        width, height = self.size
+        lines = self.server.lines
+        rows = range(height) if self.full else sorted(self.dirty)
+        runs = []
+        for y in rows:
+            if y >= height:
+                break
+            line = lines[y][:width] if y < len(lines) else ""
+            runs.append((0, y, line.ljust(width)))
+        return encode_frame(self.size, runs)
+
+    def close(self):
+        with self.server.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.ready.notify()
+            if self in self.server.clients:
+                self.server.clients.remove(self)
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # already disconnected
+        self.sock.close()
+
+
+class CanvasServer:
+    def __init__(self, canvas, path):
+        """Serve a canvas to viewers connecting to a Unix domain socket.
+
+        :param canvas: The Canvas to share; every frame it prints is served
+        :param path: The path of the socket to create
+        """
+        self.canvas = canvas
+        self.path = path
+        self.lines = []  # the canvas as last printed
+        self.clients = []
+        self.lock = threading.Lock()
+
+        _remove_stale_socket(path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(path)
+        self.sock.listen()
+        bound = os.stat(path)
+        self._inode = (bound.st_dev, bound.st_ino)
+        self._accept_thread = threading.Thread(target=self._accept, daemon=True)
+        self._accept_thread.start()
+        canvas.listeners.append(self)
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self.sock.accept()
+            except OSError:
+                return  # the server was closed
+            with self.lock:
+                self.clients.append(_Client(self, sock))
+
+    def record(self, screen, runs):
+        """Mark the changed lines of a printed frame as dirty for every client."""
+        with self.lock:
+            if runs is None or len(screen.lines) != len(self.lines):
+                self.lines = list(screen.lines)
+                changed = None
+            else:
+                changed = {y for _, y, _ in runs}
+                if not changed:
+                    return
+                for y in changed:
+                    self.lines[y] = screen.lines[y]
+            for client in self.clients:
+                client.mark(changed)
+
+    def close(self):
+        """Disconnect all clients and remove the socket."""
+        if self in self.canvas.listeners:
+            self.canvas.listeners.remove(self)
+        try:
+            # closing alone does not wake up the thread blocked in accept
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # not supported for listening sockets on this platform
+        self.sock.close()
+        with self.lock:
+            clients = list(self.clients)
+        for client in clients:
+            client.close()
+
+        # the path may have been taken over since, only remove our own socket
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if (current.st_dev, current.st_ino) == self._inode:
+            os.unlink(self.path)
+
+
+def attach(path, canvas=None):
+    """View a canvas served on a Unix domain socket until the server exits.
+
+    :param path: The path of the server's socket
+    :param canvas: The Canvas to print frames with
+    """
+    if canvas is None:
+        from .canvas import Canvas
+
+        canvas = Canvas()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(path)
+    sock.sendall(_size.pack(*canvas.size))
+    try:
+        while True:
+            # wake up regularly to notice terminal resizes
+            readable, _, _ = select.select([sock], [], [], 0.5)
+            if readable:
+                length = _length.unpack(_recv_exactly(sock, _length.size))[0]
+                size, runs = decode_frame(_recv_exactly(sock, length))
+                for x, y, text in runs:
+                    canvas.print_line((x, y), text)
+                canvas.print()
+
+            size = cursor.get_terminal_size()
+            if size != canvas.size:
+                from .canvas import Canvas
+
+                canvas = Canvas()
+                sock.sendall(_size.pack(*size))
+    except ConnectionError:
+        pass
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    attach(sys.argv[1])
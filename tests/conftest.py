@@ -0,0 +1,22 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# the repository is the package itself, import it by its directory name
+PACKAGE = os.path.basename(ROOT)
+sys.path.insert(0, os.path.dirname(ROOT))
+
+
+@pytest.fixture
+def pycat():
+    return importlib.import_module(PACKAGE)
+
+
+@pytest.fixture
+def terminal(monkeypatch, pycat):
+    """Pretend the terminal is 40x12 characters."""
+    monkeypatch.setattr(pycat.cursor, "get_terminal_size", lambda: (40, 12))
+    return (40, 12)
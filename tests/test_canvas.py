@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+
+def refresh(canvas, capsys):
+    assert canvas.refresh()
+    return capsys.readouterr().out
+
+
+def test_refresh_prints_only_changes(pycat, terminal, capsys):
+    window = pycat.Window(size=(20, 6))
+    canvas = pycat.Canvas([window])
+    window.print("hello")
+    first = refresh(canvas, capsys)
+    assert "hello" in first
+
+    canvas._next_frame = 0  # do not wait for the pacing
+    window.clear()
+    window.print("hallo")
+    second = refresh(canvas, capsys)
+    assert "hello" not in second and "a" in second
+    assert len(second) < len(first) / 4
+    assert canvas.fps == 2
+
+
+def test_refresh_with_colour_content(pycat, terminal, capsys):
+    window = pycat.Window(size=(20, 6))
+    canvas = pycat.Canvas([window])
+    window.print(pycat.colour.Red("red"))
+    out = refresh(canvas, capsys)
+    assert "red" in out.replace("\x1b[31m", "").replace("\x1b[0m", "")
+
+
+def test_refresh_drops_frames_while_busy(pycat, terminal, capsys):
+    canvas = pycat.Canvas([pycat.Window(size=(20, 6))])
+    refresh(canvas, capsys)
+    canvas._next_frame = time.perf_counter() + 60
+    assert not canvas.refresh()
+    assert canvas.refresh_pending
+    assert canvas.frame_delay > 59
+
+    canvas._next_frame = 0
+    refresh(canvas, capsys)
+    assert not canvas.refresh_pending
+
+
+@pytest.mark.parametrize(
+    "dropped, expected", [([], "w"), (["w"], "w"), (["v"], None), ([None], None)]
+)
+def test_refresh_covers_dropped_frames(pycat, terminal, capsys, dropped, expected):
+    windows = {"w": pycat.Window(size=(20, 6)), "v": pycat.Window(size=(10, 3))}
+    canvas = pycat.Canvas(list(windows.values()))
+    rendered = []
+    render = canvas.render
+    canvas.render = lambda window=None: rendered.append(window) or render(window)
+
+    canvas._next_frame = time.perf_counter() + 60
+    for name in dropped:
+        assert not canvas.refresh(windows.get(name))
+    canvas._next_frame = 0
+    assert canvas.refresh(windows["w"])
+    assert rendered == [windows.get(expected)]
+
+
+def test_restyled_row_is_printed_again(pycat, terminal, capsys):
+    window = pycat.Window(size=(20, 6))
+    canvas = pycat.Canvas([window])
+    window.print("same")
+    refresh(canvas, capsys)
+
+    canvas._next_frame = 0
+    window.clear()
+    window.print(pycat.colour.Red("same"))
+    assert "\x1b[31msame\x1b[0m" in refresh(canvas, capsys)
@@ -0,0 +1,84 @@
+import pytest
+
+
+@pytest.fixture
+def colour(pycat):
+    return pycat.colour
+
+
+def parts(text):
+    return [(t, s) for t, s in text.parts() if t]
+
+
+def test_sgr_styles(colour):
+    text = colour.from_ansi("a\x1b[1;31mb\x1b[22mc\x1b[0;44md\x1b[39;49me")
+    assert parts(text) == [
+        ("a", {}),
+        ("b", {"foreground": "red", "extra": [colour.BOLD]}),
+        ("c", {"foreground": "red"}),
+        ("d", {"background": "blue"}),
+        ("e", {}),
+    ]
+
+
+def test_styles_are_interned(colour):
+    first = colour.from_ansi("\x1b[32mx").parts()[0][1]
+    second = colour.from_ansi("\x1b[0;32my").parts()[0][1]
+    assert first is second
+
+
+def test_other_escape_sequences_are_dropped(colour):
+    text = colour.from_ansi(
+        "a\x1b]0;title\x07b\x1b]8;;url\x1b\\c\x1b(Bd\x1b7e\x1b[?25lf"
+    )
+    assert "".join(t for t, _ in text.parts()) == "abcdef"
+
+
+@pytest.mark.parametrize("split", range(1, 12))
+def test_state_carries_across_chunks(colour, split):
+    data = "x\x1b[1;34my\x1b]0;t\x07z\x1b[0mw"
+    parser = colour.AnsiParser()
+    chunks = parser.feed(data[:split]).parts() + parser.feed(data[split:]).parts()
+    merged = {}
+    for text, style in chunks:
+        for ch in text:
+            merged[ch] = style
+    assert merged == {
+        "x": {},
+        "y": {"foreground": "blue", "extra": [colour.BOLD]},
+        "z": {"foreground": "blue", "extra": [colour.BOLD]},
+        "w": {},
+    }
+
+
+def test_slicing_keeps_styles(colour):
+    text = "ab" + colour.Red("cdef") + "gh"
+    assert parts(text[1:5]) == [("b", {}), ("cde", {"foreground": "red"})]
+    assert len(text[1:5]) == 4
+
+
+def test_stray_escapes_are_removed(colour):
+    parser = colour.AnsiParser()
+    first = parser.feed("a\x1b\x01b\x1b[3")
+    second = parser.feed("1mred")
+    assert parts(first) == [("a\x01b", {})]
+    assert parts(second) == [("red", {"foreground": "red"})]
+    assert "\x1b" not in "".join(t for t, _ in colour.from_ansi("x\x1b").parts())
+
+
+def test_unterminated_osc_is_dropped(colour):
+    parser = colour.AnsiParser()
+    assert parts(parser.feed("ok\x1b]0;title")) == [("ok", {})]
+    line = "x" * 100
+    out = [parser.feed(line) for _ in range(20000)]
+    # the broken sequence swallows text until it is too long to be kept
+    assert all(len(text) == 100 for text in out[3:])
+    assert len(parser.pending) == 0
+
+
+def test_final_chunks_keep_nothing_pending(colour):
+    parser = colour.AnsiParser()
+    assert parts(parser.feed("\x1b[31mok\x1b]0;title", final=True)) == [
+        ("ok", {"foreground": "red"})
+    ]
+    assert parts(parser.feed("next")) == [("next", {"foreground": "red"})]
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+from conftest import PACKAGE, ROOT
+
+# microseconds that `import pycat` may take, measured by python -X importtime
+IMPORT_BUDGET = 5000
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(ROOT),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_time_budget():
+    stderr = run(f"import {PACKAGE}").stderr
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == PACKAGE:
+            assert int(cumulative) < IMPORT_BUDGET
+            return
+    raise AssertionError("package import not found in -X importtime output")
+
+
+def test_import_has_no_side_effects():
+    code = (
+        f"import sys, {PACKAGE}\n"
+        f"assert not {PACKAGE}.__dict__.get('cursor')\n"
+        "assert 'termios' not in sys.modules\n"
+        "assert 'ctypes' not in sys.modules\n"
+    )
+    run(code)
@@ -0,0 +1,110 @@
+import pytest
+
+
+@pytest.fixture
+def layout(pycat):
+    return pycat.layout
+
+
+@pytest.mark.parametrize(
+    "length, constraints, expected",
+    [
+        (10, ((0, None, 1), (0, None, 1)), (5, 5)),
+        (12, ((0, None, 1), (0, None, 3)), (3, 9)),
+        (10, ((0, None, 1),) * 3, (3, 3, 4)),
+        (7, ((0, None, 1),) * 3, (2, 2, 3)),
+        (20, ((0, 4, 1), (0, None, 1), (0, None, 1)), (4, 8, 8)),
+        (20, ((3, 3, 1), (0, None, 0), (2, None, 1)), (3, 0, 17)),
+        (10, ((2, None, 0), (0, 5, 1)), (2, 5)),
+        (10, ((5, None, 1), (8, None, 1)), (3, 7)),
+        (0, ((5, None, 1), (8, None, 1)), (0, 0)),
+    ],
+)
+def test_distribute(layout, length, constraints, expected):
+    assert layout.distribute(length, constraints) == expected
+
+
+@pytest.mark.parametrize("length", range(0, 50))
+def test_distribute_adds_up(layout, length):
+    constraints = ((1, None, 2), (0, 7, 3), (4, None, 1), (0, None, 5))
+    sizes = layout.distribute(length, constraints)
+    assert sum(sizes) == length
+
+
+def test_grid_validates_constraint_counts(pycat, layout):
+    panes = [layout.Pane(pycat.Window()) for _ in range(5)]
+    with pytest.raises(ValueError):
+        layout.Grid(panes, 2, row_constraints=[(0, None, 1)] * 2)
+    with pytest.raises(ValueError):
+        layout.Grid(panes, 2, column_constraints=[(0, None, 1)] * 3)
+    with pytest.raises(ValueError):
+        layout.Grid(panes, 0)
+    grid = layout.Grid(panes, 2)
+    layout.Layout(grid).solve((10, 9))
+    assert [pane.window.size for pane in panes] == [(5, 3)] * 5
+    assert panes[4].window.position == (0, 6)
+
+
+@pytest.fixture
+def tree(pycat, layout):
+    """A header above two side by side panes."""
+    panes = [layout.Pane(pycat.Window(), min=2, max=2)]
+    panes += [layout.Pane(pycat.Window()), layout.Pane(pycat.Window(), weight=3)]
+    body = layout.Split("horizontal", panes[1:])
+    return layout.Layout(layout.Split("vertical", [panes[0], body])), panes
+
+
+def test_solve_positions_windows(tree):
+    root, (header, left, right) = tree
+    root.solve((40, 12))
+    assert (header.window.position, header.window.size) == ((0, 0), (40, 2))
+    assert (left.window.position, left.window.size) == ((0, 2), (10, 10))
+    assert (right.window.position, right.window.size) == ((10, 2), (30, 10))
+
+
+def test_repeated_solve_is_cached(tree):
+    root, _ = tree
+    assert root.solve((40, 12))
+    assert root.solve((40, 12)) == []
+
+
+def test_set_solves_only_the_affected_split(tree, monkeypatch, layout):
+    root, (header, left, right) = tree
+    root.solve((40, 12))
+    solved = []
+    original = layout.Pane._solve
+    monkeypatch.setattr(
+        layout.Pane,
+        "_solve",
+        lambda self, rect: solved.append(self) or original(self, rect),
+    )
+
+    left.set(weight=3)
+    dirty = root.solve((40, 12))
+    assert solved == [left, right]
+    assert dirty == [
+        ((0, 2), (10, 10)),
+        ((0, 2), (20, 10)),
+        ((10, 2), (30, 10)),
+        ((20, 2), (20, 10)),
+    ]
+    with pytest.raises(ValueError):
+        left.set(height=3)
+
+
+def test_apply_clears_old_and_new_rectangles(pycat, terminal, tree):
+    root, (header, left, right) = tree
+    canvas = pycat.Canvas()
+    root.apply(canvas)
+    canvas.print_line((0, 0), "header")
+    canvas.print_line((0, 5), "x" * 40)
+
+    left.set(max=4)
+    assert root.apply(canvas) == [
+        ((0, 2), (10, 10)),
+        ((0, 2), (4, 10)),
+        ((10, 2), (30, 10)),
+        ((4, 2), (36, 10)),
+    ]
+    assert all(canvas.data[i][5] == 0 for i in range(40))
+    assert canvas.data[0][0] == "h"  # the header did not move
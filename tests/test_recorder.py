@@ -0,0 +1,53 @@
+import pytest
+
+
+@pytest.fixture
+def recording(pycat, terminal, tmp_path, monkeypatch, capsys):
+    """Record frames at 0, 5, 10, ... 25 seconds, with a keyframe every 10."""
+    clock = [0.0]
+    monkeypatch.setattr(pycat.recorder.time, "time", lambda: clock[0])
+    path = tmp_path / "frames"
+    window = pycat.Window(size=(20, 6))
+    canvas = pycat.Canvas([window])
+    canvas.listeners.append(pycat.recorder.Recorder(path, keyframe_interval=10))
+    for i in range(6):
+        clock[0] = i * 5.0
+        window.clear()
+        window.print("frame %d" % i)
+        canvas.render()
+        canvas.print()
+    canvas.listeners[0].close()
+    capsys.readouterr()
+    return path
+
+
+def test_keyframes_and_diffs(pycat, recording):
+    frames = list(pycat.recorder.read_frames(recording))
+    recorder = pycat.recorder
+    assert [(t, kind) for t, kind, _, _ in frames] == [
+        (0.0, recorder.KEYFRAME),
+        (5.0, recorder.DIFF),
+        (10.0, recorder.KEYFRAME),
+        (15.0, recorder.DIFF),
+        (20.0, recorder.KEYFRAME),
+        (25.0, recorder.DIFF),
+    ]
+    # a diff only holds the changed cells
+    assert frames[1][3] == [(8, 1, "1")]
+
+
+@pytest.mark.parametrize(
+    "start, first", [(0, 0.0), (12, 10.0), (19.9, 10.0), (99, 20.0)]
+)
+def test_seeking_starts_at_the_last_keyframe(pycat, recording, start, first):
+    frames = list(pycat.recorder.read_frames(recording, start=start))
+    assert frames[0][:2] == (first, pycat.recorder.KEYFRAME)
+
+
+def test_replay_from_the_middle(pycat, terminal, recording, capsys):
+    canvas = pycat.Canvas()
+    pycat.recorder.replay(recording, speed=0, start=12, canvas=canvas)
+    out = capsys.readouterr().out
+    # frames before the start are applied without being printed
+    assert "frame 2" not in out and "frame 3" in out
+    assert canvas.screen.lines[1].startswith("║ frame 5")
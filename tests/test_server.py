@@ -0,0 +1,128 @@
+import socket
+import time
+
+import pytest
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def served(pycat, terminal, tmp_path, capsys):
+    """A server for a canvas with one window, and a connected client socket."""
+    window = pycat.Window(size=(30, 10))
+    canvas = pycat.Canvas([window])
+    server = pycat.server.CanvasServer(canvas, str(tmp_path / "dashboard.sock"))
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(server.path)
+    client.settimeout(5)
+    wait_for(lambda: server.clients)
+    yield window, canvas, server, client
+    client.close()
+    server.close()
+    capsys.readouterr()
+
+
+def send_size(pycat, client, width, height):
+    client.sendall(pycat.server._size.pack(width, height))
+
+
+def receive_frame(pycat, client):
+    server = pycat.server
+    length = server._length.unpack(server._recv_exactly(client, 4))[0]
+    return server.decode_frame(server._recv_exactly(client, length))
+
+
+def test_server_refuses_to_replace_a_regular_file(pycat, terminal, tmp_path):
+    path = tmp_path / "dashboard.log"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        pycat.server.CanvasServer(pycat.Canvas(), str(path))
+    assert path.read_text() == "keep me"
+
+
+def test_server_replaces_a_stale_socket(pycat, terminal, tmp_path):
+    path = str(tmp_path / "dashboard.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    server = pycat.server.CanvasServer(pycat.Canvas(), path)
+    server.close()
+    assert not (tmp_path / "dashboard.sock").exists()
+    server._accept_thread.join(5)
+    assert not server._accept_thread.is_alive()
+
+
+def test_server_refuses_to_take_over_a_live_socket(pycat, terminal, tmp_path):
+    path = str(tmp_path / "dashboard.sock")
+    first = pycat.server.CanvasServer(pycat.Canvas(), path)
+    with pytest.raises(FileExistsError):
+        pycat.server.CanvasServer(pycat.Canvas(), path)
+    first.close()
+
+
+def test_server_keeps_a_socket_it_did_not_bind(pycat, terminal, tmp_path):
+    path = tmp_path / "dashboard.sock"
+    server = pycat.server.CanvasServer(pycat.Canvas(), str(path))
+    path.unlink()
+    other = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    other.bind(str(path))
+    server.close()
+    assert path.exists()
+    other.close()
+
+
+def test_clients_get_cropped_views(pycat, served):
+    window, canvas, server, client = served
+    window.print("hello")
+    canvas.refresh()
+
+    send_size(pycat, client, 20, 4)
+    size, runs = receive_frame(pycat, client)
+    assert size == (20, 4)
+    assert [y for _, y, _ in runs] == [0, 1, 2, 3]
+    assert all(len(text) == 20 for _, _, text in runs)
+    assert runs[1][2].startswith("║ hello")
+
+    # only the changed rows follow
+    canvas._next_frame = 0
+    window.clear()
+    window.print("hallo")
+    canvas.refresh()
+    size, runs = receive_frame(pycat, client)
+    assert [(y, text[:8]) for _, y, text in runs] == [(1, "║ hallo ")]
+
+    # a resized client gets its whole new view
+    send_size(pycat, client, 6, 2)
+    size, runs = receive_frame(pycat, client)
+    assert size == (6, 2)
+    assert [text for _, _, text in runs] == ["╔═════", "║ hall"]
+
+
+def test_frames_are_coalesced_for_slow_clients(pycat, served):
+    window, canvas, server, client = served
+    server.clients[0].sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1024)
+    send_size(pycat, client, 40, 12)
+    receive_frame(pycat, client)
+
+    # the client does not read while many frames are printed
+    frames = 200
+    for i in range(frames):
+        window.clear()
+        for j in range(8):
+            window.print("%d %d" % (i, j) * 4)
+        canvas.render()
+        canvas.print()
+
+    received = 0
+    view = {}
+    while not view.get(1, "").startswith("║ %d 0" % (frames - 1)):
+        size, runs = receive_frame(pycat, client)
+        received += 1
+        view.update({y: text for _, y, text in runs})
+    assert received < frames / 2
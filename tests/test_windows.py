@@ -0,0 +1,134 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def windows(pycat):
+    return pycat.windows
+
+
+def follow_bytes(window, data, **kwargs):
+    """Follow a pipe that delivers data in one-byte writes, until EOF."""
+    read, write = os.pipe()
+    thread = window.follow(read, **kwargs)
+    for i in range(len(data)):
+        os.write(write, data[i : i + 1])
+    os.close(write)
+    thread.join(5)
+    os.close(read)
+    window.drain()
+
+
+def test_follow_splits_lines_across_chunks(windows):
+    window = windows.ConsoleWindow()
+    follow_bytes(window, "ab\ncd\r\nčž\nend".encode())
+    assert window.content == ["ab", "cd", "čž", "end"]
+
+
+def test_follow_subprocess(windows):
+    window = windows.ConsoleWindow()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "print('\\n'.join(map(str, range(1000))))"],
+        stdout=subprocess.PIPE,
+    )
+    window.follow(process).join(5)
+    window.drain()
+    assert window.content == [str(i) for i in range(1000)]
+
+
+@pytest.mark.parametrize(
+    "scrollback, expected", [(0, []), (1, ["z"]), (None, ["x", "y", "z"])]
+)
+def test_scrollback(windows, scrollback, expected):
+    window = windows.ConsoleWindow(scrollback=scrollback)
+    follow_bytes(window, b"x\ny\nz\n")
+    assert window.content == expected
+
+
+def line_starts(data):
+    return [0] + [i + 1 for i, byte in enumerate(data) if byte == ord("\n")]
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 7, 64, 1 << 20])
+def test_pager_line_offsets(windows, tmp_path, block_size):
+    data = b"aaaaaa\nbb\ncc\n\n" + b"".join(
+        b"x" * (i * 7 % 23) + b"\n" for i in range(500)
+    )
+    path = tmp_path / "log"
+    path.write_bytes(data)
+    pager = windows.PagerWindow(path, block_size=block_size)
+    pager._index_thread.join()
+
+    starts = line_starts(data)
+    assert pager.line_count == len(starts) - 1
+    for line, offset in enumerate(starts):
+        assert pager.line_offset(line) == offset
+        assert pager.line_number(offset) == line
+    pager.close()
+
+
+def test_follow_ansi_renders_styled_cells(pycat, windows, terminal, tmp_path, capsys):
+    window = windows.ConsoleWindow(size=(20, 6), reversed=False)
+    follow_bytes(window, b"\x1b[31mred\x1b[0m ok\x1b]0;title\x07\n", ansi=True)
+    recording = tmp_path / "frames"
+    canvas = pycat.Canvas([window], record=str(recording))
+    assert canvas.refresh()
+    out = capsys.readouterr().out
+    canvas.close()
+
+    assert "\x1b[31mred\x1b[0m ok" in out
+    assert "title" not in out
+    frames = list(pycat.recorder.read_frames(recording))
+    assert any("red ok" in text for _, _, text in frames[0][3])
+
+
+def test_pending_lines_are_trimmed_to_scrollback(windows):
+    window = windows.ConsoleWindow(scrollback=3)
+    window._push([str(i) for i in range(1000)])
+    assert window._pending == ["997", "998", "999"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="pipes cannot be waited on")
+def test_unfollow_stops_a_reader_on_a_quiet_pipe(windows):
+    window = windows.ConsoleWindow()
+    read, write = os.pipe()
+    thread = window.follow(read, poll_interval=0.01)
+    window.unfollow()
+    thread.join(5)
+    assert not thread.is_alive()
+    os.close(read)
+    os.close(write)
+
+
+@pytest.mark.parametrize("data", [b"a\nbb\nccc\nd\n", b"a\nbb\nccc\nd"])
+def test_pager_goto_line_past_the_end(windows, tmp_path, data):
+    path = tmp_path / "log"
+    path.write_bytes(data)
+    pager = windows.PagerWindow(path, block_size=4)
+    pager._index_thread.join()
+    pager.goto_line(100)
+    assert pager.top == data.rindex(b"d")
+    pager.close()
+
+
+def test_pager_line_number_before_indexing(windows, tmp_path):
+    data = b"".join(b"%d\n" % i for i in range(1000))
+    path = tmp_path / "log"
+    path.write_bytes(data)
+    pager = windows.PagerWindow(path, block_size=16)
+    pager._index_thread.join()
+    pager._block_lines = [0]  # as if only the first block was indexed
+    offset = data.index(b"\n567\n") + 1
+    assert pager.line_number(offset) == 567
+    pager.close()
+
+
+def test_follow_ansi_survives_an_unterminated_osc(windows):
+    window = windows.ConsoleWindow()
+    follow_bytes(window, b"ok\x1b]0;title\n" + b"line\n" * 3, ansi=True)
+    first, *rest = window.content
+    assert "".join(text for text, _ in first.parts()) == "ok"
+    assert rest == ["line", "line", "line"]
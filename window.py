@@ -0,0 +1,110 @@
+from . import borders
+
+
+class Window:
+    def __init__(
+        self,
+        position=(0, 0),
+        size=(10, 10),
+        style="double",
+        fill=True,
+        padding=None,
+    ):
+        """Initialize an empty window.
+
+        :param position: A tuple of x,y coordinates for the top left outer corner
+        :param size: The outer size of a window (i.e. including borders)
+        :param style: Window border style (see borders.py)
+        :param fill: Whether the background of the window should be cleared
+        """
+        self.style = borders.STYLES[style]
+        self.position = position
+        self.size = size
+        self.fill = fill
+        self.padding = padding
+        self.content = []
+        if self.padding is None:
+            self.padding = [1, 2, 1, 2]  # top right bottom left
+
+    def _translate(self, x, y):
+        return (x + self.position[0], y + self.position[1])
+
+    @property
+    def inner_position(self):
+        return (self.position[0] + self.padding[3], self.position[1] + self.padding[0])
+
+    @property
+    def inner_width(self):
+        return self.size[0] - self.padding[1] - self.padding[3]
+
+    @property
+    def inner_height(self):
+        return self.size[1] - self.padding[0] - self.padding[2]
+
+    @property
+    def inner_size(self):
+        return (self.inner_width, self.inner_height)
+
+    def render_border(self, canvas):
+        """Render own border onto a given canvas."""
+        # top, bottom
+        for i in range(self.size[0]):
+            pos_up = self._translate(i, 0)
+            pos_down = self._translate(i, self.size[1] - 1)
+            if i != 0:
+                canvas.set_border(pos_up, "left", self.style)
+                canvas.set_border(pos_down, "left", self.style)
+            if i != self.size[0] - 1:
+                canvas.set_border(pos_up, "right", self.style)
+                canvas.set_border(pos_down, "right", self.style)
+            # clear inner borders
+            if self.fill and i != 0 and i != self.size[0] - 1:
+                canvas.set_border(pos_up, "down", 0)
+                canvas.set_border(pos_down, "up", 0)
+
+        # left, right
+        for j in range(self.size[1]):
+            pos_left = self._translate(0, j)
+            pos_right = self._translate(self.size[0] - 1, j)
+            if j != 0:
+                canvas.set_border(pos_left, "up", self.style)
+                canvas.set_border(pos_right, "up", self.style)
+            if j != self.size[1] - 1:
+                canvas.set_border(pos_left, "down", self.style)
+                canvas.set_border(pos_right, "down", self.style)
+            # clear inner borders
+            if self.fill and j != 0 and j != self.size[1] - 1:
+                canvas.set_border(pos_right, "left", 0)
+                canvas.set_border(pos_left, "right", 0)
+
+    def render_fill(self, canvas, fill_ch=" "):
+        for j in range(1, self.size[1] - 1):
+            for i in range(1, self.size[0] - 1):
+                pos = self._translate(i, j)
+                canvas.set_content(pos, fill_ch)
+
+    def render_content(self, canvas):
+        """Render own content (text only) onto a given canvas."""
+        pos = list(self.inner_position)
+        for line in self.content:
+            while len(line) > 0:
+                canvas.print_line(pos, line[: self.inner_width])
+                line = line[self.inner_width :]
+                pos[1] += 1
+                if pos[1] >= self.inner_height:
+                    return
+
+    def render(self, canvas):
+        """Render the entire window onto a given canvas."""
+        self.render_border(canvas)
+        if self.fill:
+            self.render_fill(canvas)
+        self.render_content(canvas)
+
+    def print(self, text):
+        """Set window content."""
+        self.content.append(text)
+
+    def clear(self):
+        """Remove all content."""
+        self.content = []
@@ -1,16 +1,194 @@
-from . import Window
+import bisect
+import codecs
+import io
+import mmap
+import os
+import select
+import sys
+import threading
+import time
+
+from .window import Window
 
 
 class ConsoleWindow(Window):
     """Window with upwards scrolling text."""
 
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        """Initialize a console window.
+
+        :param reversed: Whether the newest line is at the bottom (default True)
+        :param scrollback: Maximum number of lines to keep, or None for all
+        """
         self.reversed = kwargs.pop("reversed", True)
+        self.scrollback = kwargs.pop("scrollback", None)
+        super().__init__(**kwargs)
         self.content = []
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._followers = []
+
+    def follow(
+        self,
+        source,
+        encoding="utf-8",
+        from_end=False,
+        chunk_size=1 << 16,
+        poll_interval=0.1,
+        ansi=False,
+    ):
+        """Append lines from a file, pipe or subprocess as they arrive.
+
+        Lines are read in the background and moved into the window content
+        once per frame, when the window is rendered.
+
+        :param source: A file path, a file descriptor, a file object or a
+            subprocess.Popen started with stdout=subprocess.PIPE
+        :param encoding: Encoding of the incoming bytes
+        :param from_end: Skip existing content of a file path, like tail -f
+        :param chunk_size: Maximum number of bytes to read at once
+        :param poll_interval: Seconds to wait for a file path to grow
+        :param ansi: Convert ANSI colour codes in the lines to Colour objects
+        :return: The reader thread
+        """
+        path = None
+        if isinstance(source, (str, bytes, os.PathLike)):
+            path = source
+            fd = os.open(path, os.O_RDONLY)
+            if from_end:
+                os.lseek(fd, 0, os.SEEK_END)
+        elif isinstance(source, int):
+            fd = source
+        elif hasattr(source, "stdout") and hasattr(source, "poll"):
+            fd = source.stdout.fileno()
+        else:
+            fd = source.fileno()
+
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._follow,
+            args=(fd, path, encoding, chunk_size, poll_interval, ansi, stop),
+            daemon=True,
+        )
+        # keep the source alive, its file descriptor closes with it
+        self._followers.append((stop, source))
+        thread.start()
+        return thread
+
+    def unfollow(self):
+        """Stop reading from all followed sources.
+
+        Readers notice within poll_interval. On Windows, where pipes cannot be
+        waited on, a reader blocked on a quiet pipe stops with its next chunk.
+        """
+        for stop, _ in self._followers:
+            stop.set()
+        self._followers = []
+
+    def _follow(self, fd, path, encoding, chunk_size, poll_interval, ansi, stop):
+        decoder = self._make_decoder(encoding)
+        parser = None
+        if ansi:
+            from .colour import AnsiParser
+
+            parser = AnsiParser()
+        partial = []  # pieces of an unfinished line, joined once it ends
+        # wait for data with a timeout, so that unfollow can stop the reader
+        wait = path is None and sys.platform != "win32"
+        try:
+            while not stop.is_set():
+                if wait and not select.select([fd], [], [], poll_interval)[0]:
+                    continue
+                chunk = os.read(fd, chunk_size)
+                if chunk:
+                    # split the chunk itself; only the unfinished line from
+                    # the previous chunks is copied, into the first line
+                    lines = decoder.decode(chunk).split("\n")
+                    partial.append(lines[0])
+                    if len(lines) > 1:
+                        lines[0] = "".join(partial)
+                        partial = [lines.pop()]
+                        self._push(lines, parser)
+                    continue
+
+                # end of file
+                if path is None:
+                    break
+                rotated = self._check_rotation(fd, path)
+                if rotated is None:
+                    time.sleep(poll_interval)
+                    continue
+                # flush what is left of the old file, then start over
+                self._push_partial(partial, decoder, parser)
+                partial = []
+                decoder = self._make_decoder(encoding)
+                if rotated != fd:
+                    os.close(fd)
+                    fd = rotated
+        finally:
+            self._push_partial(partial, decoder, parser)
+            if path is not None:
+                os.close(fd)
+
+    @staticmethod
+    def _make_decoder(encoding):
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        return io.IncrementalNewlineDecoder(decoder, translate=True)
+
+    @staticmethod
+    def _check_rotation(fd, path):
+        """Return a descriptor to continue reading from, or None to keep waiting.
+
+        A file replaced under the same path is reopened from the start, and a
+        truncated file is rewound.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        own = os.fstat(fd)
+        if (stat.st_dev, stat.st_ino) != (own.st_dev, own.st_ino):
+            return os.open(path, os.O_RDONLY)
+        if stat.st_size < os.lseek(fd, 0, os.SEEK_CUR):
+            os.lseek(fd, 0, os.SEEK_SET)
+            return fd
+        return None
+
+    def _push_partial(self, partial, decoder, parser):
+        line = "".join(partial) + decoder.decode(b"", final=True)
+        if line:
+            self._push([line], parser)
+
+    def _push(self, lines, parser=None):
+        if parser is not None:
+            # lines without escape codes in an unstyled stream stay strings;
+            # escape sequences do not span lines, so each line is final
+            lines = [
+                parser.feed(line, final=True)
+                if "\x1b" in line or not parser.plain
+                else line
+                for line in lines
+            ]
+        with self._pending_lock:
+            self._pending.extend(lines)
+            # lines beyond the scrollback would be dropped by drain anyway
+            pending = self._pending
+            if self.scrollback is not None and len(pending) > self.scrollback:
+                del pending[: len(pending) - self.scrollback]
+
+    def drain(self):
+        """Move lines received by followed sources into the window content."""
+        if not self._pending:
+            return
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        self.content.extend(pending)
+        if self.scrollback is not None and len(self.content) > self.scrollback:
+            del self.content[: len(self.content) - self.scrollback]
 
     def render_content(self, canvas):
         """Render own content (text only) onto a given canvas."""
+        self.drain()
         inner_x, inner_y = self.inner_position
 
         if self.reversed:
@@ -50,3 +228,193 @@ class ListWindow(Window):
         """Render own content (text only) onto a given canvas."""
         self.content.sort()
         super().render_content(canvas)
+
+
+class PagerWindow(Window):
+    """Display a (possibly huge) file without loading it into memory.
+
+    The file is memory-mapped and only the lines in view are decoded. A sparse
+    index of line numbers at every `block_size` bytes is built in the
+    background and used to jump to arbitrary lines.
+    """
+
+    def __init__(self, path=None, encoding="utf-8", block_size=1 << 20, **kwargs):
+        """Initialize a pager window.
+
+        :param path: The file to display (see open)
+        :param encoding: Encoding used to decode displayed lines
+        :param block_size: Granularity of the line index in bytes
+        """
+        super().__init__(**kwargs)
+        self.encoding = encoding
+        self.block_size = block_size
+        self.top = 0  # byte offset of the first line in view
+        self._file = None
+        self._map = None
+        self._block_lines = []  # newlines before the start of each block
+        self._index_stop = threading.Event()
+        self._index_thread = None
+        if path is not None:
+            self.open(path)
+
+    def open(self, path):
+        """Map a file and start indexing its lines in the background."""
+        self.close()
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""
+        self.top = 0
+        self._block_lines = [0]
+        self._index_stop = threading.Event()
+        self._index_thread = threading.Thread(
+            target=self._build_index, args=(self._map, self._index_stop), daemon=True
+        )
+        self._index_thread.start()
+
+    def close(self):
+        """Stop indexing and unmap the file."""
+        self._index_stop.set()
+        if self._index_thread is not None:
+            self._index_thread.join()
+            self._index_thread = None
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._map = self._file = None
+
+    def _build_index(self, data, stop):
+        lines = 0
+        for start in range(0, len(data), self.block_size):
+            if stop.is_set():
+                return
+            lines += data[start : start + self.block_size].count(b"\n")
+            self._block_lines.append(lines)
+
+    @property
+    def size_bytes(self):
+        return 0 if self._map is None else len(self._map)
+
+    @property
+    def indexed(self):
+        """Whether the line index covers the whole file."""
+        return (len(self._block_lines) - 1) * self.block_size >= self.size_bytes
+
+    @property
+    def line_count(self):
+        """Number of lines in the file, or None while indexing."""
+        if not self.indexed:
+            return None
+        data = self._map
+        ends_open = len(data) > 0 and data[-1:] != b"\n"
+        return self._block_lines[-1] + ends_open
+
+    def line_start(self, offset):
+        """Return the offset of the start of the line containing offset."""
+        offset = max(0, min(offset, self.size_bytes))
+        return self._map.rfind(b"\n", 0, offset) + 1
+
+    def line_number(self, offset=None):
+        """Return the (0-based) line number at a byte offset (default: top)."""
+        if offset is None:
+            offset = self.top
+        block = min(offset // self.block_size, len(self._block_lines) - 1)
+        lines = self._block_lines[block]
+        # count a block at a time, the index may still be far behind offset
+        for start in range(block * self.block_size, offset, self.block_size):
+            end = min(start + self.block_size, offset)
+            lines += self._map[start:end].count(b"\n")
+        return lines
+
+    def line_offset(self, line):
+        """Return the byte offset of the start of a (0-based) line number."""
+        data = self._map
+        block_lines = self._block_lines
+        # the newline ending the previous line is in the last block that
+        # starts with fewer newlines before it than the line number
+        block = max(0, bisect.bisect_left(block_lines, line) - 1)
+        pos = block * self.block_size
+        remaining = line - block_lines[block]
+        while remaining > 0 and pos < len(data):
+            end = min(pos + self.block_size, len(data))
+            count = data[pos:end].count(b"\n")
+            if count < remaining:
+                remaining -= count
+                pos = end
+                continue
+            for _ in range(remaining):
+                pos = data.find(b"\n", pos, end) + 1
+            remaining = 0
+        return min(pos, len(data))
+
+    def goto_line(self, line):
+        """Scroll so that a given (0-based) line is at the top."""
+        offset = self.line_offset(max(0, line))
+        if offset >= self.size_bytes > 0:
+            # past the end, show the last line instead
+            offset = self.line_start(self.size_bytes - 1)
+        self.top = offset
+
+    def goto_offset(self, offset):
+        """Scroll so that the line containing a byte offset is at the top."""
+        self.top = self.line_start(offset)
+
+    def scroll(self, lines):
+        """Scroll down (positive) or up (negative) by a number of lines."""
+        data = self._map
+        pos = self.top
+        for _ in range(lines):
+            end = data.find(b"\n", pos)
+            if end == -1 or end + 1 >= len(data):
+                break
+            pos = end + 1
+        for _ in range(-lines):
+            if pos == 0:
+                break
+            pos = data.rfind(b"\n", 0, pos - 1) + 1
+        self.top = pos
+
+    def search(self, pattern, start=None, backwards=False):
+        """Find the next occurrence of a pattern and scroll to its line.
+
+        :param pattern: A string or bytes to look for
+        :param start: Byte offset to search from (default: after the top line)
+        :param backwards: Search towards the start of the file
+        :return: The byte offset of the match, or None if there is none
+        """
+        if isinstance(pattern, str):
+            pattern = pattern.encode(self.encoding)
+        data = self._map
+        if backwards:
+            match = data.rfind(pattern, 0, self.top if start is None else start)
+        else:
+            if start is None:
+                start = data.find(b"\n", self.top) + 1 or len(data)
+            match = data.find(pattern, start)
+        if match == -1:
+            return None
+        self.goto_offset(match)
+        return match
+
+    def render_content(self, canvas):
+        """Render the lines in view onto a given canvas."""
+        if self._map is None:
+            return
+        data = self._map
+        x, y = self.inner_position
+        # enough bytes for a full line of multi-byte characters
+        max_bytes = self.inner_width * 4
+        pos = self.top
+        for row in range(self.inner_height):
+            if pos >= len(data):
+                break
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = len(data)
+            line = data[pos : min(end, pos + max_bytes)]
+            text = line.decode(self.encoding, errors="replace").rstrip("\r")
+            canvas.print_line((x, y + row), text[: self.inner_width])
+            pos = end + 1